@@ -1,7 +1,11 @@
+import os
 import sys
 from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QPushButton, QFileDialog, QTabWidget, QVBoxLayout
 from PyQt5.uic import loadUiType
 
+# compiled code of loaded files: path -> (mtime_ns, size, code), one entry per file
+_code_cache = {}
+
 class DynamicTabLoader(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -44,16 +48,27 @@ class DynamicTabLoader(QMainWindow):
             self.execute_python_file(python_file)
     
     def execute_python_file(self, file_path):
-        # Clear the existing layout
-        for i in reversed(range(self.tab2_layout.count())): 
-            widget = self.tab2_layout.itemAt(i).widget()
-            if widget is not None: 
-                widget.setParent(None)
+        # Clear the existing layout and let Qt delete the old widgets in one batch
+        while self.tab2_layout.count():
+            widget = self.tab2_layout.takeAt(0).widget()
+            if widget is not None:
+                widget.deleteLater()
+        self.tab2.update()
         
         # Create a local scope dictionary to execute the file
         local_scope = {"parent_layout": self.tab2_layout}
+        exec(self.compile_python_file(file_path), {}, local_scope)
+
+    def compile_python_file(self, file_path):
+        # Only re-read and re-compile the file if it changed on disk
+        stat = os.stat(file_path)
+        cached = _code_cache.get(file_path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
         with open(file_path, "r") as file:
-            exec(file.read(), {}, local_scope)
+            code = compile(file.read(), file_path, "exec")
+        _code_cache[file_path] = (stat.st_mtime_ns, stat.st_size, code)
+        return code
 
 # Sample dynamic Python file content (for testing purposes)
 sample_python_file_content = """
@@ -89,7 +89,8 @@ if 1:
                             }
                             # Write the slice with its metadata
                             print("Writing slice with metadata: ", nSlices, " ", index)
-                            tiff_writer.write(image_data_reshaped[index], photometric='minisblack', metadata={'ImageDescription': str(metadata)})
+                            # tiled + zlib-compressed so fewer bytes hit the disk and regions can be read back partially
+                            tiff_writer.write(image_data_reshaped[index], photometric='minisblack', tile=(256, 256), compression='zlib', metadata={'ImageDescription': str(metadata)})
             
             # Optionally, you can also add global OME-XML metadata here if needed
             tiff_writer._write_image_description(ome_xml)
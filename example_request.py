@@ -1,6 +1,11 @@
 import requests
 import time
 
+# reuse one keep-alive connection for all calls instead of reconnecting per request
+session = requests.Session()
+session.mount("http://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 url = "http://169.254.165.4:8000"
 #url = "http://localhost:8000"
 
@@ -9,8 +14,8 @@ single_run = "/start_viewer_single_loop/2"
 compeleted = "/wait_for_viewer_completion/"
 
 for i in range(4):
-    response = requests.get(url+single_run)
+    response = session.get(url+single_run)
     print(response.json)
-    complete = requests.get(url+compeleted)
+    complete = session.get(url+compeleted)
     print(complete.json())
     time.sleep(5)
\ No newline at end of file
@@ -1,3 +1,4 @@
+import numpy as np
 import tifffile
 import os
 import xml.etree.ElementTree as ET
@@ -36,7 +37,14 @@ with tifffile.TiffFile(file_path) as tif:
             print("-" * 50)
 
 
+    # map the file once, every contiguous series becomes a view into it (one file descriptor in total)
+    mm = np.memmap(file_path, dtype=np.uint8, mode='r')
     for idx, image in enumerate(images):
-        # Retrieve image data
-        img_data = image.asarray()
+        # Retrieve image data, memory-map contiguous uncompressed series instead of loading them into RAM
+        if image.dataoffset is not None:
+            offset = image.dataoffset
+            img_data = mm[offset:offset+image.nbytes].view(image.dtype.newbyteorder(tif.byteorder)).reshape(image.shape)
+        else:
+            # compressed or non-contiguous series: decode strips/tiles on all cores
+            img_data = image.asarray(maxworkers=os.cpu_count())
         datas[image.name]["data"] = img_data
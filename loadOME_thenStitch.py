@@ -38,17 +38,16 @@ with tifffile.TiffFile(file_path) as tif:
 
    
     for idx, image in enumerate(images):
-        # Retrieve image data
-        img_data = image.asarray()
+        # Retrieve image data, decoding compressed strips/tiles on all cores
+        img_data = image.asarray(maxworkers=os.cpu_count())
         datas[image.name]["data"] = img_data
 
 
 import numpy as np
 from skimage.io import imsave
 from scipy.ndimage import gaussian_filter
-from collections import deque
+import queue
 import threading
-import time 
 import cv2
 import matplotlib.pyplot as plt
 #import NanoImagingPack as nip
@@ -72,33 +71,57 @@ class ImageStitcher:
         self.weight_image = np.zeros(self.stitched_image.shape, dtype=np.float32)
         self.stitched_image_shape= self.stitched_image.shape
 
-        # Queue to hold incoming images
-        self.queue = deque()
+        # Bounded queue to hold incoming images, blocks producers if placing falls behind
+        self.queue = queue.Queue(maxsize=64)
 
-        # Thread lock for thread safety
+        # Thread lock guarding the canvas
         self.lock = threading.Lock()
 
+        # Thread lock making the isRunning check + enqueue atomic with respect to stop()
+        self.queue_lock = threading.Lock()
+
         # Start a background thread for processing the queue
         self.processing_thread = threading.Thread(target=self._process_queue)
         self.isRunning = True
         self.processing_thread.start()
 
     def add_image(self, img, coords, metadata):
-        with self.lock:
-            self.queue.append((img, coords, metadata))
+        # nothing consumes the queue after stop(), a put would drop the image or block forever
+        with self.queue_lock:
+            if not self.isRunning:
+                raise RuntimeError("ImageStitcher is stopped, cannot add more images")
+            self.queue.put((img, coords, metadata))
 
     def _process_queue(self):
         #with tifffile.TiffWriter(self.file_path, bigtiff=True, append=True) as tif:
-            while self.isRunning:
-                with self.lock:
-                    if not self.queue:
-                        time.sleep(.1) # unload CPU
-                        continue
-                    img, coords, metadata = self.queue.popleft()
-                    self._place_on_canvas(img, coords)
-
-                    # write image to disk
-                    #tif.write(data=img, metadata=metadata)
+            while True:
+                # wakes up as soon as an image is added, None is the stop sentinel
+                item = self.queue.get()
+                if item is None:
+                    break
+                img, coords, metadata = item
+                try:
+                    with self.lock:
+                        self._place_on_canvas(img, coords)
+
+                        # write image to disk
+                        #tif.write(data=img, metadata=metadata)
+                except Exception as e:
+                    # keep the worker alive so stop() can still drain the queue
+                    print(e)
+                finally:
+                    self.queue.task_done()
+
+    def stop(self):
+        # holding queue_lock guarantees no producer is between its isRunning check and its put
+        with self.queue_lock:
+            if not self.isRunning:
+                return
+            self.isRunning = False
+            # block until every queued image has been placed, then let the worker exit
+            self.queue.join()
+            self.queue.put(None)
+        self.processing_thread.join()
             
 
     def _place_on_canvas(self, img, coords):
@@ -131,10 +154,10 @@ class ImageStitcher:
             print(e)
 
     def get_stitched_image(self):
+        self.stop()
         with self.lock:
             # Normalize by the weight image to get the final result
             stitched = self.stitched_image / np.maximum(self.weight_image, 1e-5)
-            self.isRunning = False
             return stitched
 
     def save_stitched_image(self, filename):